@@ -3,53 +3,72 @@ import os
 
 # Windows implementation using winreg:
 if sys.platform == "win32":
+    import atexit
     import winreg
 
+    _run_key = None          # Open handle to the Run key, shared by all functions below
+    _autostart_state = None  # Last known autostart state (None = not queried yet)
+
+    def _get_run_key():
+        """
+        Open the Run key once and reuse the handle for later calls. If write access is
+        denied, fall back to a read-only handle so the autostart state can still be queried.
+        """
+        global _run_key
+        if _run_key is None:
+            try:
+                _run_key = winreg.OpenKey(winreg.HKEY_CURRENT_USER,
+                                          r"Software\Microsoft\Windows\CurrentVersion\Run",
+                                          0, winreg.KEY_READ | winreg.KEY_WRITE)
+            except PermissionError:
+                _run_key = winreg.OpenKey(winreg.HKEY_CURRENT_USER,
+                                          r"Software\Microsoft\Windows\CurrentVersion\Run",
+                                          0, winreg.KEY_READ)
+            atexit.register(winreg.CloseKey, _run_key)
+        return _run_key
+
     def enable_autostart():
+        global _autostart_state
+        _autostart_state = None
         try:
             # Use the absolute path to your executable.
             exe_path = os.path.abspath(sys.argv[0])
-            reg_key = winreg.OpenKey(winreg.HKEY_CURRENT_USER,
-                                     r"Software\Microsoft\Windows\CurrentVersion\Run",
-                                     0, winreg.KEY_SET_VALUE)
-            winreg.SetValueEx(reg_key, "SmartPlugController", 0, winreg.REG_SZ, exe_path)
-            winreg.CloseKey(reg_key)
+            winreg.SetValueEx(_get_run_key(), "SmartPlugController", 0, winreg.REG_SZ, exe_path)
+            _autostart_state = True
             return True
         except Exception as e:
             print("Error enabling autostart on Windows:", e)
             return False
 
     def disable_autostart():
+        global _autostart_state
+        _autostart_state = None
         try:
-            reg_key = winreg.OpenKey(winreg.HKEY_CURRENT_USER,
-                                     r"Software\Microsoft\Windows\CurrentVersion\Run",
-                                     0, winreg.KEY_SET_VALUE)
-            winreg.DeleteValue(reg_key, "SmartPlugController")
-            winreg.CloseKey(reg_key)
+            winreg.DeleteValue(_get_run_key(), "SmartPlugController")
+            _autostart_state = False
             return True
         except Exception as e:
             print("Error disabling autostart on Windows:", e)
             return False
 
     def is_autostart_enabled():
+        global _autostart_state
+        if _autostart_state is not None:
+            return _autostart_state
         try:
-            reg_key = winreg.OpenKey(winreg.HKEY_CURRENT_USER,
-                                     r"Software\Microsoft\Windows\CurrentVersion\Run",
-                                     0, winreg.KEY_READ)
-            value, regtype = winreg.QueryValueEx(reg_key, "SmartPlugController")
-            winreg.CloseKey(reg_key)
-            return True
+            value, regtype = winreg.QueryValueEx(_get_run_key(), "SmartPlugController")
+            _autostart_state = True
         except FileNotFoundError:
-            return False
+            _autostart_state = False
         except Exception as e:
             print("Error checking autostart on Windows:", e)
             return False
+        return _autostart_state
 
 # macOS implementation using a LaunchAgent plist:
 elif sys.platform == "darwin":
-    import plistlib
-
     def enable_autostart():
+        import plistlib
         try:
             plist_path = os.path.expanduser("~/Library/LaunchAgents/com.smartplug.controller.plist")
             exe_path = os.path.abspath(sys.argv[0])
@@ -1,21 +1,48 @@
 import tkinter as tk
+import tkinter.font as tkfont
 import json      # For reading/writing configuration files in JSON format
 import os        # To check for file existence
+import sys       # For platform checks
 import asyncio   # For asynchronous tasks
 import threading # For running async loops in separate threads
 import psutil    # For battery info and process checking
 import time      
-from kasa import Discover         # To discover smart plugs on the network
-from kasa.iot import IotPlug        # To control individual plug sockets
+import collections  # deque for batching log lines
+import concurrent.futures  # Worker pool for blocking psutil calls
 import autostart_helper           # Our helper module for autostart functionality
+try:
+    import orjson                 # Faster JSON parsing/serialising, if installed
+except ImportError:
+    orjson = None
 
 # Config File Location
 CONFIG_FILE = "config.json"
 
+# Settings as last read from or written to config.json (None if neither has happened),
+# so saves can tell whether anything on disk would change.
+_config_on_disk = None
+
+def _remember_config(data):
+    """Record the settings that are now in the config file."""
+    global _config_on_disk
+    _config_on_disk = data
+
+def _config_to_bytes(data):
+    """Serialise settings to indented JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+def _config_from_bytes(raw):
+    """Parse JSON bytes into a settings dict, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 def load_config():
     """
     Load configuration settings from a JSON file. If the file exists, load the user's settings,
-    ensure that all required keys are present, and write back any updates.
+    ensure that all required keys are present, and write back any missing defaults.
     """
     default_config = {
         "ip_address": "10.0.0.67",
@@ -25,31 +52,93 @@ def load_config():
         "check_interval": 10
     }
     
-    if os.path.exists(CONFIG_FILE):
-        try:
-            with open(CONFIG_FILE, "r") as file:
-                user_config = json.load(file)
-            for key, default_value in default_config.items():
-                if key not in user_config:
-                    print(f"⚠️ Missing `{key}` in config.json. Using default: {default_value}")
-                    user_config[key] = default_value
-            with open(CONFIG_FILE, "w") as file:
-                json.dump(user_config, file, indent=4)
-            return user_config
-        except json.JSONDecodeError:
-            print("❌ Error: Invalid JSON format in config.json. Loading default settings.")
-            return default_config
-    return default_config
+    if not os.path.exists(CONFIG_FILE):
+        return default_config
+    try:
+        with open(CONFIG_FILE, "rb") as file:
+            user_config = _config_from_bytes(file.read())
+        changed = False
+        for key, default_value in default_config.items():
+            if key not in user_config:
+                print(f"⚠️ Missing `{key}` in config.json. Using default: {default_value}")
+                user_config[key] = default_value
+                changed = True
+        # Only rewrite the file when defaults had to be filled in, so a complete
+        # read-only config loads fine.
+        if changed:
+            try:
+                save_config_file(user_config)
+            except OSError as e:
+                print(f"⚠️ Could not write defaults back to config.json: {e}")
+        else:
+            _remember_config(user_config)
+        return user_config
+    except json.JSONDecodeError:
+        print("❌ Error: Invalid JSON format in config.json. Loading default settings.")
+        return default_config
+
+def save_config_file(new_config):
+    """
+    Write the given settings to the configuration file and remember them as saved.
+    The file is written to a temporary path first and then swapped in, so a crash
+    mid-write can't leave a truncated config behind.
+    """
+    tmp_file = CONFIG_FILE + ".tmp"
+    with open(tmp_file, "wb") as file:
+        file.write(_config_to_bytes(new_config))
+    os.replace(tmp_file, CONFIG_FILE)
+    _remember_config(new_config)
 
 config = load_config()
 
+# On Windows, read the battery straight from GetSystemPowerStatus instead of going
+# through psutil's wrapper; other platforms (or a failed lookup) use psutil.
+_GetSystemPowerStatus = None
+if sys.platform == "win32":
+    try:
+        import ctypes
+
+        class SYSTEM_POWER_STATUS(ctypes.Structure):
+            _fields_ = [
+                ("ACLineStatus", ctypes.c_ubyte),
+                ("BatteryFlag", ctypes.c_ubyte),
+                ("BatteryLifePercent", ctypes.c_ubyte),
+                ("SystemStatusFlag", ctypes.c_ubyte),
+                ("BatteryLifeTime", ctypes.c_ulong),
+                ("BatteryFullLifeTime", ctypes.c_ulong),
+            ]
+
+        _GetSystemPowerStatus = ctypes.windll.kernel32.GetSystemPowerStatus
+    except (ImportError, AttributeError, OSError):
+        _GetSystemPowerStatus = None
+
+def get_battery_status():
+    """
+    Return a (battery percent, plugged in) tuple, or None if no battery information
+    is available.
+    """
+    if _GetSystemPowerStatus is not None:
+        status = SYSTEM_POWER_STATUS()
+        if _GetSystemPowerStatus(ctypes.byref(status)):
+            # BatteryFlag 128 means "no system battery"; 255 percent means "unknown".
+            if status.BatteryFlag & 128 or status.BatteryLifePercent == 255:
+                return None
+            return status.BatteryLifePercent, status.ACLineStatus == 1
+    battery = psutil.sensors_battery()
+    if battery is None:
+        return None
+    return battery.percent, battery.power_plugged
+
 # --------------------------
 # Collapsible Pane for Settings
 # --------------------------
 class CollapsiblePane(tk.Frame):
-    def __init__(self, parent, title="", subtext="", *args, **kwargs):
+    def __init__(self, parent, title="", subtext="", *args, content_builder=None, start_open=True, **kwargs):
         tk.Frame.__init__(self, parent, *args, **kwargs)
-        self._is_open = True
+        self._is_open = start_open
+        # Called with the container the first time the pane is opened, so its widgets
+        # aren't created until they are actually shown.
+        self._content_builder = content_builder
         # Header inside the pane's border
         self.header_frame = tk.Frame(self, bg="lightgray")
         self.header_frame.pack(fill="x")
@@ -62,17 +151,27 @@ class CollapsiblePane(tk.Frame):
             self.sub_label = tk.Label(header_left, text=subtext, font=("Arial", 10, "italic"), bg="lightgray")
             self.sub_label.pack(anchor="w")
         # Right side: Toggle button using the requested icons (⇱ for collapse, ⇲ for expand)
-        self.toggle_button = tk.Button(self.header_frame, text="⇱", command=self.toggle, font=("Arial", 12), bd=2)
+        self.toggle_button = tk.Button(self.header_frame, text="⇱" if start_open else "⇲", command=self.toggle,
+                                       font=("Arial", 12), bd=2)
         self.toggle_button.pack(side="right")
         # Container for the collapsible content
         self.container = tk.Frame(self, relief="sunken", borderwidth=1)
-        self.container.pack(fill="both", expand=True)
+        if start_open:
+            self._build_content()
+            self.container.pack(fill="both", expand=True)
+
+    def _build_content(self):
+        """Run the content builder once, the first time the pane is opened."""
+        if self._content_builder is not None:
+            builder, self._content_builder = self._content_builder, None
+            builder(self.container)
 
     def toggle(self):
         if self._is_open:
-            self.container.forget()
+            self.container.pack_forget()
             self.toggle_button.config(text="⇲")
         else:
+            self._build_content()
             self.container.pack(fill="both", expand=True)
             self.toggle_button.config(text="⇱")
         self._is_open = not self._is_open
@@ -92,20 +191,57 @@ class SmartPlugApp:
     def __init__(self, root):
         self.root = root
         self.root.title("Smart Plug Controller")
+        # Shared fonts, so Tk reuses one font per style instead of parsing a tuple per widget.
+        self._font_body = tkfont.Font(family="Arial", size=12)
+        self._font_header = tkfont.Font(family="Arial", size=12, weight="bold")
+        self._font_subtext = tkfont.Font(family="Arial", size=10, slant="italic")
         self.running = False         # For monitoring loop
         self.plug = None             # Plug instance (re-discovered as needed)
+        self._plug_ip = None         # IP address the cached plug was discovered at
+        self._plug_updated_at = 0.0  # When the cached plug was last discovered
+        self._plug_ttl = 300         # Seconds before the cached plug is re-discovered
+        self._Discover = None        # kasa.Discover, imported on first discovery
+        self._plug_lock = None       # asyncio.Lock serialising plug access, made on the async loop
         self.last_status = None
         self._toggle_in_progress = False
         self.manual_override = False
         self.monitor_task = None
         self.last_plug_state = None  # Holds last reported plug state (True/False)
         self.last_app_names = []     # Holds last reported app status (list) for logging
+        self._set_monitored_apps(config["apps"])
+        self._app_cache = (0.0, False)  # (timestamp, result) of the last process scan
+        self._app_cache_ttl = 2         # Seconds a process scan result stays valid
+        self._app_scan_lock = threading.Lock()  # Scans run from worker threads
+        self._interval = config["check_interval"]  # Monitoring loop period, refreshed on save
+        self._monitor_plug_index = config["plug_number"]
+        self._monitor_ip = config["ip_address"]
+        self._stable_ticks = 0       # Monitoring passes in a row with nothing to change
+        self._monitor_wake = None    # asyncio.Event that cuts the monitoring loop's sleep short
+        self._info_condition = None  # Last (app running, below threshold, full) seen by the Info reads
+        # Queried once here and kept up to date by toggle_autostart.
+        self._autostart_enabled = autostart_helper.is_autostart_enabled()
+
+        # Last values shown in the Info section, so unchanged ticks don't touch the labels.
+        self._last_battery_text = None
+        self._last_app_running = None
+        self._default_bg = self.root.cget("bg")
+
+        # Log lines waiting to be written to the output area on the next idle cycle.
+        self._log_queue = collections.deque()
+        self._log_flush_pending = False
 
         # Set up system tray functionality.
         self.tray_icon = None
         self.root.protocol("WM_DELETE_WINDOW", self.hide_window)
 
-        # Create a dedicated async event loop for all async operations.
+        # Worker pool for blocking battery/process checks, shared by the Info updates
+        # and the monitoring loop.
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        self._info_tick = 0
+        self._info_app_running = False
+        self._info_pending = False   # True while a _read_info job is queued or running
+
+        # Create a dedicated async event loop for the smart plug (network) operations.
         if os.name == 'nt':
             self.async_loop = asyncio.ProactorEventLoop()
         else:
@@ -113,63 +249,39 @@ class SmartPlugApp:
         threading.Thread(target=self.run_async_loop, args=(self.async_loop,), daemon=True).start()
 
         # Schedule continuous Info updates every 1 second.
-        asyncio.run_coroutine_threadsafe(self.info_update_loop(), self.async_loop)
+        self.root.after(0, self._tick_info)
 
         # ===== SETTINGS SECTION (Collapsible) =====
-        self.settings_pane = CollapsiblePane(root, title="⚙️ Configuration", subtext="Get started with one-time configuration")
+        # The settings widgets are only built once the pane is opened. It starts collapsed
+        # once the one-time configuration is done (autostart enabled), so until then the
+        # saved config is used in place of the form values.
+        self.ip_entry = None
+        self.plug_number = None
+        self.battery_threshold = None
+        self.app_entry = None
+        self.autostart_button = None
+        self.settings_pane = CollapsiblePane(root, title="⚙️ Configuration", subtext="Get started with one-time configuration",
+                                             content_builder=self._build_settings,
+                                             start_open=not self._autostart_enabled)
         self.settings_pane.pack(fill="both", expand=True, padx=10, pady=5)
         self.settings_frame = self.settings_pane.container
 
-        tk.Label(self.settings_frame, text="Smart Plug IP Address:").grid(row=0, column=0, sticky="w")
-        self.ip_entry = tk.Entry(self.settings_frame, width=20, font=("Arial", 12))
-        self.ip_entry.insert(0, config["ip_address"])
-        self.ip_entry.grid(row=0, column=1, sticky="w", padx=5, pady=2, ipady=4)
-
-        tk.Label(self.settings_frame, text="Plug Number (0-2):").grid(row=1, column=0, sticky="w")
-        self.plug_number = tk.Spinbox(self.settings_frame, from_=0, to=2, width=5, font=("Arial", 12))
-        self.plug_number.delete(0, tk.END)
-        self.plug_number.insert(0, config["plug_number"])
-        self.plug_number.grid(row=1, column=1, sticky="w", padx=5, pady=2, ipady=4)
-
-        tk.Label(self.settings_frame, text="Battery Threshold (%):").grid(row=2, column=0, sticky="w")
-        self.battery_threshold = tk.Spinbox(self.settings_frame, from_=1, to=100, width=5, font=("Arial", 12))
-        self.battery_threshold.delete(0, tk.END)
-        self.battery_threshold.insert(0, config["battery_threshold"])
-        self.battery_threshold.grid(row=2, column=1, sticky="w", padx=5, pady=2, ipady=4)
-
-        tk.Label(self.settings_frame, text="Monitored Apps (comma-separated .exe names):").grid(row=3, column=0, sticky="w")
-        self.app_entry = tk.Entry(self.settings_frame, width=30, font=("Arial", 12))
-        self.app_entry.insert(0, ",".join(config["apps"]))
-        self.app_entry.grid(row=3, column=1, sticky="w", padx=5, pady=2, ipady=4)
-
-        tk.Button(self.settings_frame, text="Save Configuration", command=self.save_config, font=("Arial", 12))\
-            .grid(row=4, column=0, columnspan=2, pady=5, ipady=4)
-        
-        # New: Autostart service section inside Settings
-        tk.Label(self.settings_frame, text="Set-up always-on service:", font=("Arial", 12)).grid(row=5, column=0, sticky="w", pady=2)
-        self.autostart_button = tk.Button(self.settings_frame, text="Start on boot", font=("Arial", 12), command=self.toggle_autostart)
-        self.autostart_button.grid(row=5, column=1, sticky="w", padx=5, pady=2, ipady=4)
-        if autostart_helper.is_autostart_enabled():
-            self.autostart_button.config(text="Stop on boot")
-        else:
-            self.autostart_button.config(text="Start on boot")
-
         # ===== CONTROLS SECTION =====
         self.controls_frame = tk.LabelFrame(root, padx=10, pady=10)
         self.controls_frame.pack(fill="both", expand=True, padx=10, pady=5)
         # Header inside Controls frame
         self.controls_header = tk.Frame(self.controls_frame)
         self.controls_header.pack(fill="x", padx=10, pady=2, anchor="w")
-        tk.Label(self.controls_header, text="👆", font=("Arial", 12)).pack(side="left")
-        tk.Label(self.controls_header, text="Controls", font=("Arial", 12, "bold")).pack(side="left", padx=5)
-        tk.Label(self.controls_header, text="Monitoring and Manual Control", font=("Arial", 10, "italic")).pack(side="left", padx=5)
+        tk.Label(self.controls_header, text="👆", font=self._font_body).pack(side="left")
+        tk.Label(self.controls_header, text="Controls", font=self._font_header).pack(side="left", padx=5)
+        tk.Label(self.controls_header, text="Monitoring and Manual Control", font=self._font_subtext).pack(side="left", padx=5)
         self.controls_content = tk.Frame(self.controls_frame)
         self.controls_content.pack(fill="both", expand=True)
         self.monitor_button = tk.Button(self.controls_content, text="Start Monitoring", command=self.toggle_monitoring,
-                                        width=20, font=("Arial", 12))
+                                        width=20, font=self._font_body)
         self.monitor_button.grid(row=0, column=0, padx=5, pady=5, ipady=4)
         self.toggle_power_button = tk.Button(self.controls_content, text="Toggle Power", command=self.toggle_power,
-                                             width=20, font=("Arial", 12))
+                                             width=20, font=self._font_body)
         self.toggle_power_button.grid(row=0, column=1, padx=5, pady=5, ipady=4)
 
         # ===== INFO SECTION =====
@@ -178,17 +290,17 @@ class SmartPlugApp:
         # Header inside Info frame
         self.info_header = tk.Frame(self.info_frame)
         self.info_header.pack(fill="x", padx=10, pady=2, anchor="w")
-        tk.Label(self.info_header, text="ℹ️", font=("Arial", 12)).pack(side="left")
-        tk.Label(self.info_header, text="Information", font=("Arial", 12, "bold")).pack(side="left", padx=5)
+        tk.Label(self.info_header, text="ℹ️", font=self._font_body).pack(side="left")
+        tk.Label(self.info_header, text="Information", font=self._font_header).pack(side="left", padx=5)
         self.info_content = tk.Frame(self.info_frame)
         self.info_content.pack(fill="both", expand=True)
-        self.battery_static_label = tk.Label(self.info_content, text="🔋 Battery Status:", font=("Arial", 12))
+        self.battery_static_label = tk.Label(self.info_content, text="🔋 Battery Status:", font=self._font_body)
         self.battery_static_label.grid(row=0, column=0, padx=5, pady=2, sticky="w")
-        self.battery_dynamic_label = tk.Label(self.info_content, text="--%", font=("Arial", 12))
+        self.battery_dynamic_label = tk.Label(self.info_content, text="--%", font=self._font_body)
         self.battery_dynamic_label.grid(row=0, column=1, padx=5, pady=2, sticky="w")
-        self.app_static_label = tk.Label(self.info_content, text="💻 App(s) Running:", font=("Arial", 12))
+        self.app_static_label = tk.Label(self.info_content, text="💻 App(s) Running:", font=self._font_body)
         self.app_static_label.grid(row=1, column=0, padx=5, pady=2, sticky="w")
-        self.app_dynamic_label = tk.Label(self.info_content, text="No", font=("Arial", 12))
+        self.app_dynamic_label = tk.Label(self.info_content, text="No", font=self._font_body)
         self.app_dynamic_label.grid(row=1, column=1, padx=5, pady=2, sticky="w")
 
         # ===== OUTPUT SECTION =====
@@ -196,10 +308,43 @@ class SmartPlugApp:
         self.output_text = tk.Text(root, height=12, width=60)
         self.output_text.pack(padx=10, pady=5)
         self.log("Ready to control the Smart Plug.")
-        if autostart_helper.is_autostart_enabled():
+        if self._autostart_enabled:
             self.log("Autostart is enabled; starting monitoring automatically.")
             self.start_monitoring()
             self.monitor_button.config(text="Stop Monitoring")
+
+    def _build_settings(self, parent):
+        """Create the Settings widgets; called by the pane the first time it is opened."""
+        tk.Label(parent, text="Smart Plug IP Address:").grid(row=0, column=0, sticky="w")
+        self.ip_entry = tk.Entry(parent, width=20, font=self._font_body)
+        self.ip_entry.insert(0, config["ip_address"])
+        self.ip_entry.grid(row=0, column=1, sticky="w", padx=5, pady=2, ipady=4)
+
+        tk.Label(parent, text="Plug Number (0-2):").grid(row=1, column=0, sticky="w")
+        self.plug_number = tk.Spinbox(parent, from_=0, to=2, width=5, font=self._font_body)
+        self.plug_number.delete(0, tk.END)
+        self.plug_number.insert(0, config["plug_number"])
+        self.plug_number.grid(row=1, column=1, sticky="w", padx=5, pady=2, ipady=4)
+
+        tk.Label(parent, text="Battery Threshold (%):").grid(row=2, column=0, sticky="w")
+        self.battery_threshold = tk.Spinbox(parent, from_=1, to=100, width=5, font=self._font_body)
+        self.battery_threshold.delete(0, tk.END)
+        self.battery_threshold.insert(0, config["battery_threshold"])
+        self.battery_threshold.grid(row=2, column=1, sticky="w", padx=5, pady=2, ipady=4)
+
+        tk.Label(parent, text="Monitored Apps (comma-separated .exe names):").grid(row=3, column=0, sticky="w")
+        self.app_entry = tk.Entry(parent, width=30, font=self._font_body)
+        self.app_entry.insert(0, ",".join(config["apps"]))
+        self.app_entry.grid(row=3, column=1, sticky="w", padx=5, pady=2, ipady=4)
+
+        tk.Button(parent, text="Save Configuration", command=self.save_config, font=self._font_body)\
+            .grid(row=4, column=0, columnspan=2, pady=5, ipady=4)
+        
+        # New: Autostart service section inside Settings
+        tk.Label(parent, text="Set-up always-on service:", font=self._font_body).grid(row=5, column=0, sticky="w", pady=2)
+        self.autostart_button = tk.Button(parent, text="Start on boot", font=self._font_body, command=self.toggle_autostart)
+        self.autostart_button.grid(row=5, column=1, sticky="w", padx=5, pady=2, ipady=4)
+        if self._autostart_enabled:
             self.autostart_button.config(text="Stop on boot")
         else:
             self.autostart_button.config(text="Start on boot")
@@ -207,12 +352,48 @@ class SmartPlugApp:
     def run_async_loop(self, loop):
         """Run the dedicated asynchronous event loop."""
         asyncio.set_event_loop(loop)
+        # Created here so it belongs to this loop; held around every use of the shared plug.
+        self._plug_lock = asyncio.Lock()
         loop.run_forever()
 
+    def _ip_address(self):
+        """IP address from the Settings form, or the saved config if the form isn't built yet."""
+        if self.ip_entry is None:
+            return config["ip_address"]
+        return self.ip_entry.get()
+
+    def _plug_index(self):
+        """
+        Plug number from the Settings form, or the saved config if the form isn't built yet.
+        Logs and returns None if the form holds something that isn't a number.
+        """
+        if self.plug_number is None:
+            return config["plug_number"]
+        try:
+            return int(self.plug_number.get())
+        except ValueError:
+            self.log(f"❌ Error: invalid plug number {self.plug_number.get()!r}.")
+            return None
+
     def log(self, message):
-        """Log a message to the output text area."""
-        self.output_text.insert(tk.END, message + "\n")
-        self.output_text.see(tk.END)
+        """
+        Log a message to the output text area. Messages are queued and written in one
+        batch when Tk is next idle, so bursts of log lines only redraw once.
+        """
+        self._log_queue.append(message)
+        if not self._log_flush_pending:
+            self._log_flush_pending = True
+            self.root.after_idle(self._flush_log)
+
+    def _flush_log(self):
+        """Write all queued log messages to the output text area."""
+        self._log_flush_pending = False
+        lines = []
+        while self._log_queue:
+            lines.append(self._log_queue.popleft())
+        if lines:
+            self.output_text.insert(tk.END, "\n".join(lines) + "\n")
+            self.output_text.see(tk.END)
 
     def save_config(self):
         """Save settings from the UI to the configuration file and update in-memory config."""
@@ -223,36 +404,49 @@ class SmartPlugApp:
             "apps": [app.strip() for app in self.app_entry.get().split(",") if app.strip()],
             "check_interval": 10
         }
-        with open(CONFIG_FILE, "w") as file:
-            json.dump(new_config, file, indent=4)
         global config
+        # Compare against what was read from disk rather than the in-memory config, which
+        # holds the defaults when config.json is missing or unreadable.
+        if new_config == _config_on_disk:
+            self.log("ℹ️ No changes to save.")
+            return
+        save_config_file(new_config)
         config = new_config
+        self._set_monitored_apps(config["apps"])
+        self._app_cache = (0.0, False)
+        self._interval = config["check_interval"]
         self.log("✅ Configuration saved successfully!")
-        if autostart_helper.is_autostart_enabled():
+        if self._autostart_enabled:
             self.autostart_button.config(text="Stop on boot")
         else:
             self.autostart_button.config(text="Start on boot")
 
     def toggle_autostart(self):
         """Toggle the always-on service using the helper module."""
-        if autostart_helper.is_autostart_enabled():
+        if self._autostart_enabled:
             if autostart_helper.disable_autostart():
+                self._autostart_enabled = False
                 self.log("Autostart disabled.")
                 self.autostart_button.config(text="Start on boot")
             else:
                 self.log("Error disabling autostart.")
         else:
             if autostart_helper.enable_autostart():
+                self._autostart_enabled = True
                 self.log("Autostart enabled.")
                 self.autostart_button.config(text="Stop on boot")
             else:
                 self.log("Error enabling autostart.")
 
-    async def discover_plug(self):
-        """Discover the smart plug using the provided IP address."""
+    async def discover_plug(self, ip):
+        """Discover the smart plug at the given IP address."""
         self.log("🔄 Discovering smart plugs...")
         try:
-            plug = await Discover.discover_single(self.ip_entry.get())
+            if self._Discover is None:
+                # kasa is slow to import, so it is loaded on first use rather than at startup.
+                from kasa import Discover
+                self._Discover = Discover
+            plug = await self._Discover.discover_single(ip)
             await plug.update()
             self.log(f"✅ Found device: {plug.alias}")
             return plug
@@ -260,11 +454,34 @@ class SmartPlugApp:
             self.log(f"❌ Error discovering plug: {e}")
             return None
 
-    async def toggle_manual(self):
+    async def _get_plug(self, ip):
+        """
+        Return the cached plug, re-discovering it if there is none, it is stale,
+        or the IP address has changed. Callers must hold self._plug_lock, and call
+        _drop_plug after an error so the connection is closed and re-discovered.
+        """
+        if (self.plug is not None and self._plug_ip == ip
+                and time.monotonic() - self._plug_updated_at < self._plug_ttl):
+            return self.plug
+        if self.plug is not None and hasattr(self.plug, "close"):
+            try:
+                await self.plug.close()
+            except Exception:
+                pass
+        self.plug = await self.discover_plug(ip)
+        self._plug_ip = ip
+        self._plug_updated_at = time.monotonic()
+        return self.plug
+
+    def _drop_plug(self):
+        """Mark the cached plug stale so the next _get_plug closes it and re-discovers."""
+        self._plug_updated_at = 0.0
+
+    async def toggle_manual(self, plug_index, ip):
         """
         Toggle the power state of the smart plug.
-        Always re-discovers the plug so subsequent toggles work reliably.
-        Prevents overlapping toggles and closes the plug connection after toggling.
+        Reuses the cached plug connection and only re-discovers after an error.
+        Prevents overlapping toggles.
         """
         if self._toggle_in_progress:
             self.log("Toggle already in progress.")
@@ -272,108 +489,155 @@ class SmartPlugApp:
         self._toggle_in_progress = True
         self.manual_override = True
         try:
-            self.log("🔄 Discovering smart plugs...")
-            self.plug = await Discover.discover_single(self.ip_entry.get())
-            await self.plug.update()
-            self.log(f"✅ Found device: {self.plug.alias}")
-
-            plug_index = int(self.plug_number.get())
-            if hasattr(self.plug, "children") and self.plug.children:
-                child_plug = self.plug.children[plug_index]
-                await child_plug.update()
-                if child_plug.is_on:
-                    desired_state = False
-                    await child_plug.turn_off()
+            async with self._plug_lock:
+                plug = await self._get_plug(ip)
+                if not plug:
+                    return
+
+                if hasattr(plug, "children") and plug.children:
+                    child_plug = plug.children[plug_index]
+                    await child_plug.update()
+                    if child_plug.is_on:
+                        desired_state = False
+                        await child_plug.turn_off()
+                    else:
+                        desired_state = True
+                        await child_plug.turn_on()
+                    await asyncio.sleep(0.5)
+                    await child_plug.update()
+                    self.log(f"✅ Plug {plug_index} is now {'ON' if desired_state else 'OFF'}.")
                 else:
-                    desired_state = True
-                    await child_plug.turn_on()
-                await asyncio.sleep(0.5)
-                await child_plug.update()
-                self.log(f"✅ Plug {plug_index} is now {'ON' if desired_state else 'OFF'}.")
-            else:
-                self.log("❌ No child sockets detected. This may not be a power strip!")
+                    self.log("❌ No child sockets detected. This may not be a power strip!")
         except Exception as e:
             self.log(f"❌ Error: {e}")
-            self.plug = None
+            self._drop_plug()
         finally:
-            try:
-                if self.plug and hasattr(self.plug, "close"):
-                    await self.plug.close()
-            except Exception as e2:
-                self.log(f"❌ Error closing plug: {e2}")
             self._toggle_in_progress = False
             self.manual_override = False
 
     def toggle_power(self):
         """Schedule the manual toggle coroutine on the shared async loop."""
-        asyncio.run_coroutine_threadsafe(self.toggle_manual(), self.async_loop)
+        plug_index = self._plug_index()
+        if plug_index is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.toggle_manual(plug_index, self._ip_address()), self.async_loop)
 
     def update_info(self, battery, charging, app_running):
-        """Update the Info section labels."""
-        if charging:
-            self.battery_dynamic_label.config(text=f"⚡ {battery}%")
-        else:
-            self.battery_dynamic_label.config(text=f"{battery}%")
-        if app_running:
-            self.app_dynamic_label.config(text="Yes", bg="#71d17c")
-        else:
-            self.app_dynamic_label.config(text="No", bg=self.root.cget("bg"))
+        """Update the Info section labels, skipping any whose value hasn't changed."""
+        battery_text = f"⚡ {battery}%" if charging else f"{battery}%"
+        if battery_text != self._last_battery_text:
+            self.battery_dynamic_label.config(text=battery_text)
+            self._last_battery_text = battery_text
+        if app_running != self._last_app_running:
+            if app_running:
+                self.app_dynamic_label.config(text="Yes", bg="#71d17c")
+            else:
+                self.app_dynamic_label.config(text="No", bg=self._default_bg)
+            self._last_app_running = app_running
 
-    async def info_update_loop(self):
-        """Continuously update the Info section every second."""
-        while True:
-            battery = psutil.sensors_battery()
+    def _tick_info(self):
+        """
+        Refresh the Info section every second, driven by Tk's after() timer.
+        Battery is read on every tick, but the process scan only runs every few ticks
+        (derived from check_interval) and its result is reused in between. The reads
+        run in the worker pool so the Tk thread never blocks on psutil. A tick is skipped
+        while the previous read is still running, so slow scans can't pile up in the pool.
+        """
+        if not self._info_pending:
+            scan_every = max(1, config["check_interval"] // 2)
+            scan_apps = self._info_tick % scan_every == 0
+            self._info_tick += 1
+            self._info_pending = True
+            self._executor.submit(self._read_info, scan_apps)
+        self.root.after(1000, self._tick_info)
+
+    def _read_info(self, scan_apps):
+        """Read battery (and, if asked, app) status in the worker pool and post it to the Tk thread."""
+        try:
+            battery = get_battery_status()
             if battery is not None:
-                battery_level = battery.percent
-                charging = battery.power_plugged
+                battery_level, charging = battery
             else:
                 battery_level = 0
                 charging = False
-            app_running = self.is_app_running()
-            self.root.after(0, lambda: self.update_info(battery_level, charging, app_running))
-            await asyncio.sleep(1)
+            if scan_apps:
+                self._info_app_running = self.is_app_running()
+            # Wake the monitoring loop as soon as something it acts on changes, instead of
+            # waiting out its backed-off sleep.
+            condition = (self._info_app_running, battery_level < config["battery_threshold"], battery_level >= 100)
+            if condition != self._info_condition:
+                self._info_condition = condition
+                self._wake_monitor()
+            self.root.after(0, self.update_info, battery_level, charging, self._info_app_running)
+        finally:
+            self._info_pending = False
+
+    def _wake_monitor(self):
+        """Cut the monitoring loop's current sleep short; safe to call from any thread."""
+        wake = self._monitor_wake
+        if wake is not None:
+            self.async_loop.call_soon_threadsafe(wake.set)
+
+    async def _monitor_sleep(self, seconds):
+        """Sleep between monitoring passes, returning early (and resetting the backoff) when woken."""
+        try:
+            await asyncio.wait_for(self._monitor_wake.wait(), seconds)
+            self._stable_ticks = 0
+        except asyncio.TimeoutError:
+            pass
+        self._monitor_wake.clear()
 
     async def control_smart_plug(self):
         """
         Main control loop: periodically checks battery level and monitored apps,
         then toggles the plug accordingly.
         Skips automatic control if manual override is active.
-        (Battery and app info are updated exclusively via info_update_loop.)
+        The plug is only queried when the battery/app state asks for a different state
+        than the one last set; while nothing changes, the poll interval backs off up to
+        a minute, and the Info reads wake it early when the battery or app state changes.
+        (Battery and app info are updated exclusively via _tick_info.)
         """
-        self.plug = await self.discover_plug()
-        if not self.plug:
+        # Read once per monitoring run (start_monitoring) instead of querying the widgets each pass.
+        ip = self._monitor_ip
+        plug_index = self._monitor_plug_index
+        async with self._plug_lock:
+            plug = await self._get_plug(ip)
+        if not plug:
             return
 
-        plug_index = int(self.plug_number.get())
-        if not (hasattr(self.plug, "children") and self.plug.children):
+        if not (hasattr(plug, "children") and plug.children):
             self.log("❌ No child sockets detected. This may not be a power strip!")
             return
 
-        child_plug = self.plug.children[plug_index]
+        child_plug = plug.children[plug_index]
         if self.last_plug_state is None:
             self.last_plug_state = child_plug.is_on
         if self.last_app_names is None:
             self.last_app_names = []
+        self._stable_ticks = 0
+        self._monitor_wake = asyncio.Event()
         while self.running:
+            interval = self._interval
             if self.manual_override:
-                await asyncio.sleep(config["check_interval"])
+                await self._monitor_sleep(interval)
                 continue
             try:
-                await child_plug.update()
-                battery = psutil.sensors_battery()
+                loop = asyncio.get_running_loop()
+                battery = await loop.run_in_executor(self._executor, get_battery_status)
                 if battery is None:
                     self.log("❌ No battery information available.")
-                    await asyncio.sleep(config["check_interval"])
+                    await self._monitor_sleep(interval)
                     continue
-                battery_level = battery.percent
+                battery_level = battery[0]
                 # Check app status (we revert to generic messages)
-                app_running = self.is_app_running()
+                app_running = await loop.run_in_executor(self._executor, self.is_app_running)
                 if self.last_app_names != app_running:
                     if app_running:
                         self.log("✅ User-specified app(s) are running.")
                     else:
                         self.log("✅ User-specified app(s) are closed.")
                     self.last_app_names = app_running
+                    self._stable_ticks = 0
 
                 if app_running:
                     desired_state = True
@@ -382,24 +646,48 @@ class SmartPlugApp:
                 elif battery_level >= 100:
                     desired_state = False
                 else:
-                    desired_state = child_plug.is_on
+                    desired_state = None  # Leave the plug as it is
 
-                if desired_state != child_plug.is_on and self.last_plug_state != desired_state:
-                    if desired_state:
-                        await child_plug.turn_on()
-                        self.log(f"✅ Plug {plug_index} turned ON (Condition met).")
-                    else:
-                        await child_plug.turn_off()
-                        self.log(f"✅ Plug {plug_index} turned OFF (Condition met).")
-                    self.last_plug_state = desired_state
-                await asyncio.sleep(config["check_interval"])
+                # Nothing can change unless we want a different state than the last one set,
+                # so skip the plug round trip and back off the poll interval.
+                if desired_state is None or desired_state == self.last_plug_state:
+                    self._stable_ticks += 1
+                    await self._monitor_sleep(min(60, interval * 2 ** min(self._stable_ticks, 6)))
+                    continue
+                self._stable_ticks = 0
+
+                async with self._plug_lock:
+                    plug = await self._get_plug(ip)
+                    if plug:
+                        child_plug = plug.children[plug_index]
+                        await child_plug.update()
+                        if desired_state != child_plug.is_on:
+                            if desired_state:
+                                await child_plug.turn_on()
+                                self.log(f"✅ Plug {plug_index} turned ON (Condition met).")
+                            else:
+                                await child_plug.turn_off()
+                                self.log(f"✅ Plug {plug_index} turned OFF (Condition met).")
+                if not plug:
+                    await self._monitor_sleep(interval)
+                    continue
+                # Either we just switched it or it was already there; both mean no further RPCs
+                # are needed until the desired state changes.
+                self.last_plug_state = desired_state
+                await self._monitor_sleep(interval)
             except Exception as e:
                 self.log(f"❌ Error: {e}")
-                await asyncio.sleep(config["check_interval"])
+                self._drop_plug()
+                await self._monitor_sleep(interval)
 
     def start_monitoring(self):
         """Start the monitoring loop by scheduling the control coroutine on the shared async loop."""
         if not self.running:
+            plug_index = self._plug_index()
+            if plug_index is None:
+                return
+            self._monitor_plug_index = plug_index
+            self._monitor_ip = self._ip_address()
             self.running = True
             self.monitor_task = asyncio.run_coroutine_threadsafe(self.control_smart_plug(), self.async_loop)
             self.log("🔄 Monitoring started...")
@@ -408,6 +696,11 @@ class SmartPlugApp:
         """Stop the monitoring loop."""
         self.running = False
         self.manual_override = False
+        # Cancel rather than wait for the loop to notice, so a quick restart can't leave
+        # the old loop running alongside the new one after its sleep ends.
+        if self.monitor_task is not None:
+            self.monitor_task.cancel()
+            self.monitor_task = None
         self.log("🛑 Monitoring stopped.")
 
     def toggle_monitoring(self):
@@ -417,24 +710,57 @@ class SmartPlugApp:
             self.monitor_button.config(text="Start Monitoring")
         else:
             self.start_monitoring()
-            self.monitor_button.config(text="Stop Monitoring")
+            if self.running:
+                self.monitor_button.config(text="Stop Monitoring")
+
+    def _set_monitored_apps(self, apps):
+        """Precompute the lower-cased set of monitored app names used by is_app_running."""
+        self._monitored_apps_lower = frozenset(app.lower() for app in apps)
 
     def is_app_running(self):
-        """Check if any monitored application is running (case-insensitive)."""
-        monitored_apps = [app.lower() for app in config["apps"]]
-        for proc in psutil.process_iter(['name']):
-            name = proc.info['name']
-            if name and name.lower() in monitored_apps:
-                return True
-        return False
+        """
+        Check if any monitored application is running (case-insensitive).
+        The result of a process scan is reused for a couple of seconds, since both
+        the Info loop and the monitoring loop ask for it.
+        """
+        with self._app_scan_lock:
+            now = time.monotonic()
+            timestamp, running = self._app_cache
+            if now - timestamp < self._app_cache_ttl:
+                return running
+            monitored_apps = self._monitored_apps_lower
+            if not monitored_apps:
+                return False
+            # process_iter reuses its Process objects between calls, and on Windows their
+            # name() is cached, so a reused PID would keep reporting the old process's name.
+            # is_running() compares create times; on reuse, look the name up afresh (the
+            # stale object is also dropped from process_iter's cache on the next call).
+            running = False
+            for proc in psutil.process_iter(['name']):
+                name = proc.info['name']
+                if not proc.is_running():
+                    try:
+                        name = psutil.Process(proc.pid).name()
+                    except (psutil.NoSuchProcess, psutil.AccessDenied):
+                        continue
+                if name and name.lower() in monitored_apps:
+                    running = True
+                    break
+            self._app_cache = (now, running)
+            return running
 
     # --------------------------
     # System Tray (Background Service) Support
     # --------------------------
     def hide_window(self):
         """Hide the main window and create a system tray icon."""
-        self.root.withdraw()
         self.create_tray_icon()
+        # Only hide once the tray icon exists, otherwise there'd be no way to get the window back;
+        # without a tray icon, closing the window exits the app instead.
+        if self.tray_icon:
+            self.root.withdraw()
+        else:
+            self.exit_app()
 
     def show_window(self):
         """Show the main window and remove the system tray icon."""
@@ -446,15 +772,18 @@ class SmartPlugApp:
     def create_tray_icon(self):
         """Create a system tray icon with menu options to Show and Exit."""
         try:
+            from PIL import Image
+            import pystray
             icon_path = os.path.join(os.path.dirname(__file__), "icon.png")
             image = Image.open(icon_path)
         except Exception as e:
             print("Error loading tray icon:", e)
+            self.log(f"❌ Error loading tray icon: {e}")
             return
 
         menu = pystray.Menu(
-            pystray.MenuItem("Show", lambda: self.show_window()),
-            pystray.MenuItem("Exit", lambda: self.exit_app())
+            pystray.MenuItem("Show", self.show_window),
+            pystray.MenuItem("Exit", self.exit_app)
         )
         self.tray_icon = pystray.Icon("Smart Plug Controller", image, "Smart Plug Controller", menu)
         threading.Thread(target=self.tray_icon.run, daemon=True).start()
@@ -466,9 +795,6 @@ class SmartPlugApp:
         self.root.destroy()
 
 if __name__ == "__main__":
-    import sys
-    from PIL import Image
-    import pystray
     root = tk.Tk()
     if sys.platform.startswith("win"):
         icon_path = os.path.join(os.path.dirname(__file__), "icon.ico")
@@ -490,3 +816,4 @@ if __name__ == "__main__":
     app.monitor_button.config(command=app.toggle_monitoring)
     root.mainloop()
     app.async_loop.stop()  # Stop the async loop when the GUI is closed.
+    app._executor.shutdown(wait=False)